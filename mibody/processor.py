@@ -23,8 +23,13 @@ Options:
 [default: lbs].
 """
 
+import collections.abc
+import numpy as np
+import functools
 import datetime
-import docopt
+import tempfile
+import hashlib
+import zipfile
 import math
 import json
 import csv
@@ -33,6 +38,176 @@ import os
 import io
 
 
+# Layout of a single record: year, month, day, hour, minute, second,
+# gender/age, height, fitness level, weight, body fat, (unused), muscle mass
+# and visceral fat, with the two-byte values stored big-endian
+
+_ROW_DTYPE = np.dtype([
+    ('year', '>u2'), ('month', 'u1'), ('day', 'u1'), ('hour', 'u1'),
+    ('minute', 'u1'), ('second', 'u1'), ('gender_age', 'u1'),
+    ('height', 'u1'), ('fitness_level', 'u1'), ('weight', '>u2'),
+    ('body_fat', '>u2'), ('unused', 'V1'), ('muscle_mass', '>u2'),
+    ('visceral_fat', 'u1'),
+])
+
+# Columns from files already processed, by real path, along with the file's
+# modification time and size when it was read. Only the most recently
+# processed files are kept
+
+_PARSE_CACHE = {}
+_PARSE_CACHE_SIZE = 16
+
+# Columns held for each record, all of which an on-disk cache must provide
+
+_FIELDS = (
+    'date_time', 'gender', 'age', 'height', 'fitness_level', 'weight',
+    'body_fat', 'muscle_mass', 'visceral_fat')
+
+# BMI lower bounds for each classification after the first, so a BMI's
+# label is found by counting the bounds it has reached
+
+_BMI_CUTOFFS = (18.5, 25, 30, 35, 40)
+_BMI_LABELS = (
+    'underweight', 'healthy weight', 'overweight', 'class I obesity',
+    'class II obesity', 'class III obesity')
+
+# Mifflin - St Jeor BMR adjustment for each gender, any other gender having
+# no BMR
+
+_BMR_GENDERS = ('F', 'M')
+_BMR_OFFSETS = (-161, 5)
+
+# Multiply a weight in KG by these to convert it to other units
+
+_WEIGHT_FACTORS = {
+    'lbs': 2.2046226218,
+    'oz': 35.27396195,
+    'stones': 0.15747,
+}
+
+
+def _remember_columns(path, stamp, columns):
+
+    """
+    Keeps the columns processed from the file at the given path for reuse,
+    forgetting the longest held files once there are too many.
+
+    :param path: str (real path)
+    :param stamp: tuple (modification time and size of the file)
+    :param columns: dict (of field name to numpy.ndarray)
+    :return: tuple (stamp, columns)
+    """
+
+    _PARSE_CACHE.pop(path, None)
+    _PARSE_CACHE[path] = stamp, columns
+
+    while len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+        del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+
+    return _PARSE_CACHE[path]
+
+
+def _decode_rows(buf):
+
+    """
+    Decodes an (N, 18) array of raw records in to its columns of values.
+
+    :param buf: numpy.ndarray
+    :return: tuple (years, months, days, hours, minutes, seconds, males,
+        ages, heights, fitness levels, weights, body fats, muscle masses,
+        visceral fats)
+    """
+
+    records = np.ascontiguousarray(buf).view(_ROW_DTYPE)[:, 0]
+
+    return (
+        records['year'],
+        records['month'],
+        records['day'],
+        records['hour'],
+        records['minute'],
+        records['second'],
+        records['gender_age'] & 0x80 != 0,
+        records['gender_age'] & 0x7F,
+        records['height'],
+        records['fitness_level'],
+        records['weight'] / 10,
+        records['body_fat'] / 10,
+        records['muscle_mass'] / 10,
+        records['visceral_fat'],
+    )
+
+
+def _bmrs(weights, heights, ages, gender_indexes):
+
+    """
+    Works out the (rounded) Mifflin - St Jeor BMR for each record.
+
+    :param weights: numpy.ndarray (KG)
+    :param heights: numpy.ndarray (CM)
+    :param ages: numpy.ndarray
+    :param gender_indexes: numpy.ndarray (index in to _BMR_GENDERS, or -1
+        for any other gender)
+    :return: numpy.ndarray
+    """
+
+    bmrs = np.rint(
+        10 * weights + 6.25 * heights - 5 * ages +
+        np.asarray(_BMR_OFFSETS)[gender_indexes]).astype(np.int64)
+    bmrs[gender_indexes < 0] = 0
+
+    return bmrs
+
+
+def _derive_columns(columns):
+
+    """
+    Works out the values derived from the given columns of record data, such
+    as unit conversions, BMI and BMR.
+
+    :param columns: dict (of field name to numpy.ndarray)
+    :return: dict (of value name to numpy.ndarray)
+    """
+
+    weights = columns['weight']
+    heights = columns['height']
+    genders = columns['gender']
+
+    # There's no BMI without a height, so those records are left as NaN
+
+    with np.errstate(divide='ignore'):
+        inv_hmsqs = 10000.0 / (heights.astype(np.float64) * heights)
+    inv_hmsqs[heights == 0] = np.nan
+    unrounded_bmis = weights * inv_hmsqs
+
+    # np.round scales by 100 before rounding, which can land the other side
+    # of a halfway point to round(), so we round each value here
+
+    bmis = np.array([round(bmi, 2) for bmi in unrounded_bmis.tolist()])
+    classifications = np.asarray(_BMI_LABELS)[
+        np.searchsorted(_BMI_CUTOFFS, bmis, side='right')]
+    classifications[np.isnan(bmis)] = ''
+
+    gender_indexes = np.full(len(genders), -1)
+    for index, gender in enumerate(_BMR_GENDERS):
+        gender_indexes[genders == gender] = index
+    bmrs = _bmrs(weights, heights, columns['age'], gender_indexes)
+
+    return {
+        'date_time_str': np.char.replace(
+            np.datetime_as_string(columns['date_time'], unit='s'), 'T', ' '),
+        'weight_oz': weights * _WEIGHT_FACTORS['oz'],
+        'weight_lbs': weights * _WEIGHT_FACTORS['lbs'],
+        'weight_stones': weights * _WEIGHT_FACTORS['stones'],
+        'height_m': heights / 100,
+        'height_inches': heights / 2.54,
+        'height_feet': heights / 30.48,
+        'bmi': bmis,
+        'classification': classifications,
+        'bmr': bmrs,
+    }
+
+
 class JSONEncoder(json.JSONEncoder):
 
     """
@@ -45,16 +220,144 @@ class JSONEncoder(json.JSONEncoder):
         if isinstance(obj, datetime.datetime):
             return str(obj)
 
+        # Records are encoded as their data
+        if isinstance(obj, BodyDataRow):
+            return dict(obj)
+
         return json.JSONEncoder.default(self, obj)
 
 
-class BodyDataRow(dict):
+def derived(method):
+
+    """
+    Turns a BodyDataRow method, which only describes the value, in to a
+    property reading the record's value from the matching column of derived
+    values held by BodyData.
+    """
+
+    name = method.__name__
+
+    @functools.wraps(method)
+    def getter(self):
+        return self._parent._derived_columns()[name].item(self._index)
+
+    return property(getter)
+
+
+class BodyDataRow(collections.abc.Mapping):
 
     """
     Gives us some funky utilities with each record so we can do conversions
     easily and Pythonically.
+
+    Rows are views on to a single index of the columns held by BodyData, so
+    reading and writing values goes straight to the underlying arrays. Fields
+    other than those read from the file are kept with BodyData per record.
     """
 
+    __slots__ = ('_parent', '_index')
+
+    def __init__(self, parent, index):
+
+        """
+        Sets up the view.
+
+        :param parent: BodyData
+        :param index: int
+        """
+
+        self._parent = parent
+        self._index = index
+
+    def __getitem__(self, key):
+
+        """
+        Returns the value of the given field for this record.
+        """
+
+        column = self._parent._cols.get(key)
+        if column is None:
+            return self._parent._extra.get(self._index, {})[key]
+
+        return column.item(self._index)
+
+    def __setitem__(self, key, value):
+
+        """
+        Stores the value, updating anything derived from the old data. Values
+        for fields read from the file must fit the field's type unchanged.
+        """
+
+        column = self._parent._cols.get(key)
+        if column is None:
+            self._parent._extra.setdefault(self._index, {})[key] = value
+            return
+
+        try:
+            with np.errstate(invalid='ignore', over='ignore'):
+                stored = np.array([value]).astype(column.dtype)[0]
+            unchanged = bool(stored.item() == value)
+        except (TypeError, ValueError):
+            unchanged = False
+
+        if not unchanged:
+            raise ValueError(
+                "Value, {!r} can't be stored in field, '{}' without changing "
+                "it".format(value, key))
+
+        column[self._index] = stored
+        self._parent._refresh_derived(self._index)
+
+    def __iter__(self):
+
+        """
+        Iterates over the field names.
+        """
+
+        yield from self._parent._cols
+        yield from self._parent._extra.get(self._index, ())
+
+    def __len__(self):
+
+        """
+        Returns the number of fields.
+        """
+
+        return len(self._parent._cols) + len(
+            self._parent._extra.get(self._index, ()))
+
+    def copy(self):
+
+        """
+        Returns the record's data as a plain dict.
+        """
+
+        return dict(self)
+
+    def update(self, *args, **kwargs):
+
+        """
+        Updates the record, updating anything derived from the old data.
+        """
+
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __repr__(self):
+
+        """
+        Represents the record as its data.
+        """
+
+        return repr(self.copy())
+
+    @derived
+    def date_time_str(self):
+
+        """
+        Provides the date/time for the record as 'YYYY-MM-DD HH:MM:SS'.
+        """
+
     @property
     def weight_kg(self):
 
@@ -64,24 +367,20 @@ class BodyDataRow(dict):
 
         return self.weight
 
-    @property
+    @derived
     def weight_oz(self):
 
         """
         Provides the weight for the record in ounces.
         """
 
-        return self.weight_kg * 35.27396195
-
-    @property
+    @derived
     def weight_lbs(self):
 
         """
         Provides the weight for the record in lbs.
         """
 
-        return self.weight_kg * 2.2046226218
-
     @property
     def weight_lbs_oz(self):
 
@@ -89,20 +388,18 @@ class BodyDataRow(dict):
         Provides the weight for the record as (lbs, oz).
         """
 
-        whole_lbs = math.floor(self.weight_lbs)
-        dec_oz = self.weight_lbs - whole_lbs
+        lbs = self.weight_lbs
+        whole_lbs = int(lbs)
 
-        return whole_lbs, dec_oz * 16
+        return whole_lbs, (lbs - whole_lbs) * 16
 
-    @property
+    @derived
     def weight_stones(self):
 
         """
         Provides the weight for the record in stones.
         """
 
-        return self.weight_kg * 0.15747
-
     @property
     def weight_stones_lbs(self):
 
@@ -110,10 +407,10 @@ class BodyDataRow(dict):
         Provides the weight for the record in stones.
         """
 
-        whole_stones = math.floor(self.weight_stones)
-        dec_lbs = self.weight_stones - whole_stones
+        stones = self.weight_stones
+        whole_stones = int(stones)
 
-        return whole_stones, dec_lbs * 14
+        return whole_stones, (stones - whole_stones) * 14
 
     @property
     def height_cm(self):
@@ -124,33 +421,27 @@ class BodyDataRow(dict):
 
         return self.height
 
-    @property
+    @derived
     def height_m(self):
 
         """
         Provides the height for the record in metres.
         """
 
-        return self.height_cm / 100
-
-    @property
+    @derived
     def height_inches(self):
 
         """
         Provides the height for the record in inches.
         """
 
-        return self.height_cm / 2.54
-
-    @property
+    @derived
     def height_feet(self):
 
         """
         Provides the height for the record in feet.
         """
 
-        return self.height_cm / 30.48
-
     @property
     def height_feet_inches(self):
 
@@ -158,12 +449,12 @@ class BodyDataRow(dict):
         Provides the height for the record as (feet, inches).
         """
 
-        whole_feet = math.floor(self.height_feet)
-        dec_inches = self.height_feet - whole_feet
+        feet = self.height_feet
+        whole_feet = int(feet)
 
-        return whole_feet, dec_inches * 12
+        return whole_feet, (feet - whole_feet) * 12
 
-    @property
+    @derived
     def bmr(self):
 
         """
@@ -172,89 +463,82 @@ class BodyDataRow(dict):
         Calculated using the Mifflin - St Jeor method.
         """
 
-        unmodified_bmr = \
-            10 * self.weight_kg + 6.25 * self.height_cm - 5 * self.age
-
-        if self.gender == 'M':
-            unmodified_bmr += 5
-        elif self.gender == 'F':
-            unmodified_bmr -= 161
-        else:
-            unmodified_bmr = 0
-
-        return round(unmodified_bmr)
-
-    @property
+    @derived
     def bmi(self):
 
         """
-        Returns the Body Mass Index for the record (rounded to 2 d.p.).
+        Returns the Body Mass Index for the record (rounded to 2 d.p.), or NaN
+        when the record has no height.
         """
 
-        return round(self.weight_kg / self.height_m**2, 2)
-
-    @property
+    @derived
     def classification(self):
 
         """
         Returns the classification for the BMI result. Answers one of:
 
         underweight, healthy weight, overweight, class I/II/III obesity
-        """
 
-        bmi = self.bmi
-
-        if bmi < 18.5:
-            return 'underweight'
-        elif 18.5 <= bmi < 25:
-            return 'healthy weight'
-        elif 25 <= bmi < 30:
-            return 'overweight'
-        elif 30 <= bmi < 35:
-            return 'class I obesity'
-        elif 35 <= bmi < 40:
-            return 'class II obesity'
-        elif bmi >= 40:
-            return 'class III obesity'
-        else:
-            return ''
+        Answers '' when the record has no height.
+        """
 
-    def __getattribute__(self, item):
+    def __getattr__(self, item):
 
         """
-        Allow attribute-based key access to data.
+        Allow attribute-based key access to data. Only called once the usual
+        attribute lookup has failed, so properties never pay for it.
         """
 
-        if item in self:
-            return self[item]
+        if item.startswith('_'):
+            raise AttributeError(item)
 
-        return super(BodyDataRow, self).__getattribute__(item)
+        try:
+            return self[item]
+        except KeyError:
+            raise AttributeError(item)
 
 
-class BodyData(list):
+class BodyData(object):
 
     """
     Reads the raw data written by Salter MiBody scales and turns it in to
     useful information. Particularly useful to those using an operating system
     other than those supported by the official software provided.
+
+    The data is held as one array per field, with records handed out as
+    BodyDataRow views on to those arrays.
     """
 
-    def __init__(self, file_path_or_object):
+    def __init__(self, file_path_or_object, cache_dir=None, cache=False):
 
         """
         Accepts a path or file object to make use of.
 
+        Files are processed afresh each time unless asked otherwise. With
+        cache=True, data read from a path is kept for the rest of the session,
+        and reused while the file's modification time and size stay the same.
+        Providing cache_dir keeps it on disk as well, for use by later
+        sessions. As the scales always write files of the same size, a file
+        rewritten within its file system's timestamp resolution looks
+        unchanged, so only cache when that can't happen.
+
         :param file_path_or_object: str or file
+        :param cache_dir: str (optional, directory to cache processed data in,
+            implies cache)
+        :param cache: bool (whether to reuse, and keep, processed data)
         """
 
-        super(BodyData, self).__init__([])
-
-        self.row_block_size = 18
+        self.row_block_size = _ROW_DTYPE.itemsize
 
         self.file_path_or_object = file_path_or_object
         self.final_data = []
         self.file_object = None
 
+        self._cols = {}
+        self._extra = {}
+        self._derived = None
+        self._rows = []
+
         # Check for initial argument data type
 
         if isinstance(file_path_or_object, str):
@@ -275,9 +559,76 @@ class BodyData(list):
                 raise TypeError(
                     "File, '{}' not found".format(self.file_path_or_object))
 
-        self._process()
+        if isinstance(file_path_or_object, str) and (
+                cache or cache_dir is not None):
+            self._process_cached(cache_dir)
+        else:
+            self._process()
         self.file_object.close()
 
+    def _process_cached(self, cache_dir=None):
+
+        """
+        Processes the file at the given path, unless it has been processed
+        already and is unchanged since.
+
+        :param cache_dir: str (optional, directory to cache processed data in)
+        """
+
+        path = os.path.realpath(self.file_path_or_object)
+        stat = os.fstat(self.file_object.fileno())
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        # The on-disk copy is named after the path alone, so it's replaced
+        # when the file changes, and carries the stamp it was made from
+
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = os.path.join(
+                os.path.expanduser(cache_dir),
+                '{}.npz'.format(hashlib.sha1(os.fsencode(path)).hexdigest()))
+
+        cached = _PARSE_CACHE.get(path)
+        if (cached is None or cached[0] != stamp) and cache_path:
+            try:
+                with open(cache_path, 'rb') as cache_file_object, \
+                        np.load(cache_file_object) as cache_file:
+                    if tuple(cache_file['_stamp'].tolist()) == stamp:
+                        cached = _remember_columns(path, stamp, {
+                            name: cache_file[name] for name in _FIELDS})
+            except (
+                    IOError, OSError, EOFError, ValueError, KeyError,
+                    NotImplementedError, zipfile.BadZipFile):
+                pass
+
+        if cached is not None and cached[0] == stamp:
+            self._cols = {
+                name: values.copy() for name, values in cached[1].items()}
+            self._derived = None
+            self._rows = [None] * len(self)
+            return
+
+        self._process()
+
+        _remember_columns(path, stamp, {
+            name: values.copy() for name, values in self._cols.items()})
+
+        if cache_path:
+            cache_file = None
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                        dir=os.path.dirname(cache_path),
+                        delete=False) as cache_file:
+                    np.savez(cache_file, _stamp=np.array(stamp), **self._cols)
+                os.replace(cache_file.name, cache_path)
+            except (IOError, OSError, ValueError):
+                if cache_file is not None:
+                    try:
+                        os.unlink(cache_file.name)
+                    except OSError:
+                        pass
+
     def _process(self):
 
         """
@@ -286,79 +637,192 @@ class BodyData(list):
 
         self.final_data = []
 
-        while True:
+        try:
+            data = self.file_object.read()
+        except UnicodeDecodeError:
+            data = ''
 
-            try:
-                block = self.file_object.read(self.row_block_size)
-            except UnicodeDecodeError:
-                self.file_object.close()
-                raise ValueError(
-                    'Read failed, please ensure the file object is opened as '
-                    'binary')
-            if len(block) != self.row_block_size:
-                break
-
-            if block[0]:  # First part of year, seems to be 7 each time
-
-                # Get the date/time
-
-                year = block[0] << 8
-                year += block[1]
-                month = block[2]
-                day = block[3]
-                hour = block[4]
-                minute = block[5]
-                second = block[6]
-
-                weighing_date_time = datetime.datetime(
-                    year, month, day, hour, minute, second)
-
-                # Get gender and age
-
-                if block[7] & 128 == 0:
-                    gender = 'F'
-                else:
-                    gender = 'M'
-                age = block[7] & ~128
-
-                # Get body measurements
-
-                height = block[8]
-                fitness_level = block[9]
-
-                weight_1 = block[10]
-                weight_2 = block[11]
-                weight = ((weight_1 << 8) + weight_2) / 10
-
-                body_fat_1 = block[12]
-                body_fat_2 = block[13]
-                body_fat = ((body_fat_1 << 8) + body_fat_2) / 10
-
-                muscle_mass_1 = block[15]
-                muscle_mass_2 = block[16]
-                muscle_mass = ((muscle_mass_1 << 8) + muscle_mass_2) / 10
-
-                visceral_fat = block[17]
-
-                # Record data
-
-                self.append(BodyDataRow({
-                    'date_time': weighing_date_time,
-                    'gender': gender,
-                    'age': age,
-                    'height': height,
-                    'fitness_level': fitness_level,
-                    'weight': weight,
-                    'body_fat': body_fat,
-                    'muscle_mass': muscle_mass,
-                    'visceral_fat': visceral_fat,
-                }))
-
-        if not len(self):
+        if isinstance(data, str):
+            self.file_object.close()
+            raise ValueError(
+                'Read failed, please ensure the file object is opened as '
+                'binary')
+
+        # Lay the data out as one row per block, dropping any trailing bytes
+
+        buf = np.frombuffer(data, dtype=np.uint8)
+        buf = buf[:len(buf) // self.row_block_size * self.row_block_size]
+        buf = buf.reshape(-1, self.row_block_size)
+
+        # First part of year, seems to be 7 each time
+
+        buf = buf[buf[:, 0] != 0]
+
+        if not len(buf):
             self.file_object.close()
             raise ValueError('File, \'{}\' has yielded no weigh-ins'.format(
                 self.file_path_or_object))
 
+        (
+            years, months, days, hours, minutes, seconds, males, ages,
+            heights, fitness_levels, weights, body_fats, muscle_masses,
+            visceral_fats,
+        ) = _decode_rows(buf)
+
+        # Build the date/times as datetime64 values, only turning them in to
+        # datetime objects when a record's date/time is asked for. Each part
+        # is checked as datetime.datetime would have done
+
+        month_starts = (
+            (years.astype(np.int64) - 1970) * 12 + months - 1).astype('M8[M]')
+        dates = month_starts.astype('M8[D]') + (days.astype(np.int64) - 1)
+
+        invalid = (
+            (years < datetime.MINYEAR) | (years > datetime.MAXYEAR) |
+            (months < 1) | (months > 12) | (days < 1) |
+            (dates.astype('M8[M]') != month_starts) |
+            (hours > 23) | (minutes > 59) | (seconds > 59))
+        if invalid.any():
+            self.file_object.close()
+            raise ValueError(
+                'File, \'{}\' has an invalid date/time in weigh-in {}'.format(
+                    self.file_path_or_object, np.flatnonzero(invalid)[0] + 1))
+
+        weighing_date_times = dates.astype('M8[s]') + (
+            (hours.astype(np.int64) * 60 + minutes) * 60 + seconds)
+        genders = np.where(males, 'M', 'F')
+
+        # Record data
+
+        self._cols = {
+            'date_time': weighing_date_times,
+            'gender': genders,
+            'age': ages.astype(int),
+            'height': heights.astype(int),
+            'fitness_level': fitness_levels.astype(int),
+            'weight': weights,
+            'body_fat': body_fats,
+            'muscle_mass': muscle_masses,
+            'visceral_fat': visceral_fats.astype(int),
+        }
+
+        self._derived = None
+
+        self._rows = [None] * len(self)
+
+    def __len__(self):
+
+        """
+        Returns the number of records.
+        """
+
+        return len(self._cols.get('weight', ()))
+
+    def __getitem__(self, index):
+
+        """
+        Returns the record at the given index (or a list of them for a slice),
+        creating its view the first time it's asked for.
+
+        :param index: int or slice
+        :return: BodyDataRow or list
+        """
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        index = range(len(self))[index]
+
+        row = self._rows[index]
+        if row is None:
+            row = self._rows[index] = BodyDataRow(self, index)
+
+        return row
+
+    def __iter__(self):
+
+        """
+        Iterates over the records.
+        """
+
+        for index in range(len(self)):
+            yield self[index]
+
+    def __copy__(self):
+
+        """
+        Returns a copy whose records can be modified without affecting this
+        one, without processing the file again.
+
+        :return: BodyData
+        """
+
+        body_data = self.__class__.__new__(self.__class__)
+        body_data.__dict__.update(self.__dict__)
+
+        body_data._cols = {
+            name: values.copy() for name, values in self._cols.items()}
+        if self._derived is not None:
+            body_data._derived = {
+                name: values.copy() for name, values in self._derived.items()}
+        body_data._extra = {
+            index: dict(fields) for index, fields in self._extra.items()}
+        body_data._rows = [None] * len(self)
+
+        return body_data
+
+    def _derived_columns(self):
+
+        """
+        Returns the derived values for every record, working them out in one
+        go the first time they're needed.
+
+        :return: dict (of value name to numpy.ndarray)
+        """
+
+        if self._derived is None:
+            self._derived = _derive_columns(self._cols)
+
+        return self._derived
+
+    def _refresh_derived(self, index):
+
+        """
+        Brings the derived values for a single record up to date after it has
+        been modified.
+
+        :param index: int
+        """
+
+        if self._derived is None:
+            return
+
+        row_derived = _derive_columns({
+            name: values[index:index + 1]
+            for name, values in self._cols.items()})
+
+        for name, values in row_derived.items():
+            self._derived[name][index] = values[0]
+
+    def column(self, name):
+
+        """
+        Returns the values of a field (e.g. 'weight') or a derived value (e.g.
+        'weight_lbs', 'bmi' or 'classification') for every record.
+
+        :param name: str
+        :return: numpy.ndarray (read-only)
+        """
+
+        if name in self._cols:
+            values = self._cols[name].view()
+        else:
+            values = self._derived_columns()[name].view()
+
+        values.flags.writeable = False
+
+        return values
+
     def _multi_value_export_format(self, _format, value):
 
         """
@@ -423,63 +887,67 @@ class BodyData(list):
             'bmr': 'BMR',
         }
 
-        final_data = []
-        for record in self:
-
-            final_record = record.copy()
-
-            # Set up height and weight values
-
-            final_height = record['height']  # Height already in CM
-            if height == 'ft_in':
-                final_height = self._multi_value_export_format(
-                    _format, record.height_feet_inches)
-            final_record.update({'height': final_height})
-
-            final_weight = record['weight']  # Weight already in KG
-            if weight == 'lbs':
-                final_weight = record.weight_lbs
-            if weight == 'st_lbs':
-                final_weight = self._multi_value_export_format(
-                    _format, record.weight_stones_lbs)
-            final_record.update({'weight': final_weight})
-
-            final_record['gender'] = (
-                'Male' if final_record['gender'] == 'M' else 'Female')
-
-            # Add the BMI and BMR values to the data
-
-            final_record['bmi'] = record.bmi
-            final_record['bmr'] = record.bmr
-
-            final_data.append({
-                val: final_record[key] for key, val in key_val_map.items()})
+        # Gather the values to export, converting a column at a time
+
+        columns = {
+            name: values.tolist() for name, values in self._cols.items()
+            if name != 'date_time'}
+        columns['date_time'] = self.column('date_time_str').tolist()
+
+        if height == 'ft_in':
+            feet = self.column('height_feet')
+            whole_feet = feet.astype(int)
+            columns['height'] = [
+                self._multi_value_export_format(_format, value)
+                for value in zip(
+                    whole_feet.tolist(), ((feet - whole_feet) * 12).tolist())]
+
+        if weight == 'lbs':
+            columns['weight'] = self.column('weight_lbs').tolist()
+        elif weight == 'st_lbs':
+            stones = self.column('weight_stones')
+            whole_stones = stones.astype(int)
+            columns['weight'] = [
+                self._multi_value_export_format(_format, value)
+                for value in zip(
+                    whole_stones.tolist(),
+                    ((stones - whole_stones) * 14).tolist())]
+
+        columns['gender'] = [
+            'Male' if gender == 'M' else 'Female'
+            for gender in columns['gender']]
+
+        # Add the BMI and BMR values to the data, with no BMI for records
+        # without a height
+
+        columns['bmi'] = [
+            None if math.isnan(bmi) else bmi
+            for bmi in self.column('bmi').tolist()]
+        columns['bmr'] = self.column('bmr').tolist()
 
         # Next step is to represent the data as requested
 
         final_data_str = io.StringIO()
         if _format == 'csv':
 
-            field_names = [
-                key_val_map['date_time'],
-                key_val_map['gender'],
-                key_val_map['age'],
-                key_val_map['height'],
-                key_val_map['fitness_level'],
-                key_val_map['weight'],
-                key_val_map['bmi'],
-                key_val_map['body_fat'],
-                key_val_map['muscle_mass'],
-                key_val_map['visceral_fat'],
-                key_val_map['bmr'],
+            field_keys = [
+                'date_time', 'gender', 'age', 'height', 'fitness_level',
+                'weight', 'bmi', 'body_fat', 'muscle_mass', 'visceral_fat',
+                'bmr',
             ]
 
-            writer = csv.DictWriter(
-                final_data_str, fieldnames=field_names)
-            writer.writeheader()
-            writer.writerows(final_data)
+            # Rows go straight from the columns to the writer, without
+            # building a dict for each one
+
+            writer = csv.writer(final_data_str)
+            writer.writerow([key_val_map[key] for key in field_keys])
+            writer.writerows(zip(*[columns[key] for key in field_keys]))
         elif _format == 'json':
-            final_data_str.write(json.dumps(final_data, cls=JSONEncoder))
+            final_data = [
+                dict(zip(key_val_map.values(), values))
+                for values in zip(*[columns[key] for key in key_val_map])]
+            final_data_str.write(json.dumps(
+                final_data, cls=JSONEncoder, separators=(',', ':')))
 
         # We need to set the file index to 0 before writing the data
 
@@ -492,12 +960,10 @@ class BodyData(list):
         elif destination == 'stdout':
             print(final_data_str.read(), file=sys.stdout)
         elif hasattr(destination, 'seek'):
-            for line in final_data_str.readlines():
-                destination.write(line)
+            destination.write(final_data_str.read())
         else:
             with open(destination, 'w') as f:
-                for line in final_data_str.readlines():
-                    f.write(line)
+                f.write(final_data_str.read())
 
     def __str__(self):
 
@@ -519,14 +985,40 @@ class BodyData(list):
         return '<BodyData \'{}\'>'.format(self.file_object.name)
 
 
-if __name__ == '__main__':
+def main(argv=None, stdout=None, stderr=None):
 
     """
     Handle command line arguments should one wish to do it that way.
+
+    :param argv: list (defaults to sys.argv[1:])
+    :param stdout: file-like (defaults to sys.stdout)
+    :param stderr: file-like (defaults to sys.stderr)
+    :return: int (exit status)
     """
 
+    stdout = sys.stdout if stdout is None else stdout
+    stderr = sys.stderr if stderr is None else stderr
+
+    import docopt
+
     this_file_dir = os.path.dirname(os.path.abspath(__file__))
-    arguments = docopt.docopt(__doc__, version='0.1')
+
+    # Help, the version and usage errors are handled here, rather than by
+    # docopt, so they go to the given streams and return a status
+
+    try:
+        arguments = docopt.docopt(__doc__, argv=argv, help=False)
+    except docopt.DocoptExit as e:
+        print(str(e), file=stderr)
+        return 1
+
+    if arguments['--help']:
+        print(__doc__.strip('\n'), file=stdout)
+        return 0
+
+    if arguments['--version']:
+        print('0.1', file=stdout)
+        return 0
 
     def _resolve_path(path, mode=os.R_OK):
 
@@ -571,13 +1063,24 @@ if __name__ == '__main__':
             raise TypeError('Format, \'{}\' is invalid'.format(
                 arguments['--format']))
 
-        destination_path = arguments['--output']
-        if destination_path != 'stdout':
-            destination_path = _resolve_path(destination_path, os.W_OK)
+        export_options = dict(
+            _format=arguments['--format'], height=arguments['--height'],
+            weight=arguments['--weight'])
 
-        processed_body_data.export(
-            destination_path, arguments['--format'],
-            height=arguments['--height'], weight=arguments['--weight'])
+        destination_path = arguments['--output']
+        if destination_path == 'stdout':
+            print(processed_body_data.export(**export_options).read(),
+                  file=stdout)
+        else:
+            processed_body_data.export(
+                _resolve_path(destination_path, os.W_OK), **export_options)
 
     except (TypeError, ValueError, AssertionError) as e:
-        print(str(e), file=sys.stderr)
+        print(str(e), file=stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
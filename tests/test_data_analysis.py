@@ -1,16 +1,20 @@
-from mibody.processor import BodyDataRow
+from mibody.processor import BodyDataRow, JSONEncoder, main, _PARSE_CACHE
 from unittest import TestCase
 from mibody import BodyData
+import numpy as np
 import subprocess
+import tempfile
 import datetime
+import pathlib
+import copy
 import json
 import csv
 import sys
 import os
+import io
 
 
-THIS_FILE_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_DIR = os.path.realpath(os.path.join(THIS_FILE_DIR, '..'))
+PROJECT_DIR = str(pathlib.Path(__file__).resolve().parent.parent)
 PYTHON_INTERPRETER = sys.executable
 
 
@@ -20,32 +24,32 @@ class TestMiBodyProcessing(TestCase):
     Tests the processing of MiBody data only.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
 
         """
-        Checks a few things first.
+        Checks a few things first, once for all of the tests.
         """
 
-        self.processor_dir = os.path.join(PROJECT_DIR, 'mibody')
-        self.assertTrue(
-            os.path.isdir(self.processor_dir),
-            'Processor directory does not exist')
+        cls.processor_dir = os.path.join(PROJECT_DIR, 'mibody')
+        assert os.path.isdir(cls.processor_dir), \
+            'Processor directory does not exist'
 
-        self.processor_filename = 'processor.py'
-        self.processor_path = os.path.join(
-            self.processor_dir, self.processor_filename)
-        self.assertTrue(
-            os.path.isfile(self.processor_path),
-            'Processor file doss not exist')
+        cls.processor_filename = 'processor.py'
+        cls.processor_path = os.path.join(
+            cls.processor_dir, cls.processor_filename)
+        assert os.path.isfile(cls.processor_path), \
+            'Processor file doss not exist'
 
-        self.correct_bodydata_path = '../tests/BODYDATA.TXT'
-        self.correct_csv_export_path = '../tests/BODYDATA.CSV'
-        self.correct_json_export_path = '../tests/BODYDATA.JSON'
+        cls.correct_bodydata_path = '../tests/BODYDATA.TXT'
+        cls.correct_csv_export_path = '../tests/BODYDATA.CSV'
+        cls.correct_json_export_path = '../tests/BODYDATA.JSON'
 
     def _shell_call(self, params=None, *args, **extrakwargs):
 
         """
         Provides a method to call subprocess.Popen without the additional args.
+        Either stream can be discarded by passing subprocess.DEVNULL for it.
 
         :param params: list
         :return: subprocess.Popen instance, stdout, stderr
@@ -62,12 +66,28 @@ class TestMiBodyProcessing(TestCase):
         kwargs.update(extrakwargs)
 
         process = subprocess.Popen(params, *args, **kwargs)
-        response = process, process.stdout.read(), process.stderr.read()
+        try:
+            stdout, stderr = process.communicate(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+
+        return process, stdout or b'', stderr or b''
+
+    def _main_call(self, params=None):
 
-        process.stdout.close()
-        process.stderr.close()
+        """
+        Calls the command line entry point in-process, capturing its output.
 
-        return response
+        :param params: list
+        :return: exit status, stdout, stderr
+        """
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        status = main(params or [], stdout=stdout, stderr=stderr)
+
+        return status, stdout.getvalue().encode(), stderr.getvalue().encode()
 
     def test_uploading_empty_files(self):
 
@@ -81,6 +101,26 @@ class TestMiBodyProcessing(TestCase):
             str(err.exception),
             'File, \'tests/EMPTY_FILE.TXT\' has yielded no weigh-ins')
 
+    def test_uploading_invalid_date_times(self):
+
+        """
+        Tests uploading files with a weigh-in which has an impossible
+        date/time.
+        """
+
+        record = [
+            7, 220, 1, 2, 3, 4, 5, 21, 175, 0, 2, 155, 0, 145, 0, 1, 210, 3]
+
+        for year, month, day in ((2012, 2, 30), (65535, 1, 2)):
+            invalid_record = [year >> 8, year & 0xFF, month, day] + record[4:]
+            file_object = io.BytesIO(bytes(record + invalid_record))
+            with self.assertRaises(ValueError) as err:
+                BodyData(file_object)
+            self.assertEqual(
+                str(err.exception),
+                'File, \'{}\' has an invalid date/time in weigh-in 2'.format(
+                    file_object))
+
     def test_providing_invalid_file_path(self):
 
         """
@@ -102,14 +142,158 @@ class TestMiBodyProcessing(TestCase):
 
         self.assertEqual(len(body_data), 35)
 
-        for record in body_data:
-            self.assertIsInstance(record, BodyDataRow)
-            self.assertIsInstance(record.date_time, datetime.datetime)
-            self.assertGreater(record.visceral_fat, 0)
-            self.assertGreater(record.height, 0)
-            self.assertGreater(record.weight, 0)
-            self.assertGreater(record.age, 0)
-            self.assertEqual(record.gender, 'M')
+        self.assertIsInstance(body_data[0], BodyDataRow)
+        self.assertIsInstance(body_data[0].date_time, datetime.datetime)
+        self.assertEqual(body_data.column('date_time').dtype.kind, 'M')
+
+        for name in ('visceral_fat', 'height', 'weight', 'age'):
+            self.assertTrue(np.all(body_data.column(name) > 0), name)
+        self.assertTrue(np.all(body_data.column('gender') == 'M'))
+
+    def test_modifying_records(self):
+
+        """
+        Tests changing records, which must not quietly alter the values given.
+        """
+
+        record = BodyData('tests/BODYDATA.TXT')[0]
+
+        for key, value in (('gender', 'Female'), ('age', 30.7), ('age', '30')):
+            with self.assertRaises(ValueError):
+                record[key] = value
+        self.assertEqual((record.gender, record.age), ('M', 21))
+
+        record['age'] = 30.0
+        self.assertEqual(record.age, 30)
+        self.assertEqual(record.bmr, 1616)
+
+        # Other fields are kept for the record alone
+
+        record['notes'] = 'After a run'
+        self.assertEqual(record.notes, 'After a run')
+        self.assertEqual(list(record)[-1], 'notes')
+        self.assertEqual(
+            json.loads(json.dumps(record, cls=JSONEncoder)),
+            dict(record, date_time=str(record.date_time)))
+
+    def test_exporting_records_without_height(self):
+
+        """
+        Tests records without a height are exported without a BMI.
+        """
+
+        body_data = BodyData(io.BytesIO(bytes(
+            [7, 220, 1, 2, 3, 4, 5, 21, 0, 0, 2, 155, 0, 145, 0, 1, 210, 3])))
+
+        self.assertTrue(np.isnan(body_data[0].bmi))
+        self.assertEqual(body_data[0].classification, '')
+        self.assertTrue(np.isnan(body_data.column('bmi')[0]))
+        self.assertEqual(body_data.column('classification')[0], '')
+
+        self.assertIsNone(json.loads(body_data.export().read())[0]['BMI'])
+        rows = list(csv.DictReader(body_data.export(_format='csv')))
+        self.assertEqual(rows[0]['BMI'], '')
+
+    def test_caching_processed_data(self):
+
+        """
+        Tests processed data is reused, without changes to one set of data
+        showing up in another.
+        """
+
+        _PARSE_CACHE.clear()
+        BodyData('tests/BODYDATA.TXT')
+        self.assertEqual(_PARSE_CACHE, {})
+
+        body_data_1 = BodyData('tests/BODYDATA.TXT', cache=True)
+        body_data_1[0]['weight'] = 100
+        self.assertEqual(len(_PARSE_CACHE), 1)
+
+        body_data_2 = BodyData('tests/BODYDATA.TXT', cache=True)
+        self.assertEqual(body_data_2[0].weight, 66.7)
+
+        body_data_copy = copy.copy(body_data_2)
+        body_data_copy[0]['weight'] = 100
+        self.assertEqual(body_data_copy[0].bmi, 32.65)
+        self.assertEqual(body_data_2[0].weight, 66.7)
+        self.assertEqual(body_data_2[0].bmi, 21.78)
+
+        # Now cache to disk, and read back without the in-memory copy
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+
+            _PARSE_CACHE.clear()
+            body_data_3 = BodyData('tests/BODYDATA.TXT', cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            _PARSE_CACHE.clear()
+            body_data_4 = BodyData('tests/BODYDATA.TXT', cache_dir=cache_dir)
+            self.assertEqual(
+                body_data_4.export().read(), body_data_3.export().read())
+
+            # A damaged cache file is processed again, and replaced
+
+            cache_path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+            with open(cache_path, 'r+b') as cache_file:
+                cache_file.truncate(100)
+
+            _PARSE_CACHE.clear()
+            body_data_5 = BodyData('tests/BODYDATA.TXT', cache_dir=cache_dir)
+            self.assertEqual(
+                body_data_5.export().read(), body_data_3.export().read())
+            self.assertEqual(os.listdir(cache_dir), [
+                os.path.basename(cache_path)])
+            self.assertGreater(os.path.getsize(cache_path), 100)
+
+        # Changes to the file replace its cache file, rather than adding more
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            cache_dir = os.path.join(temp_dir, 'cache')
+            body_data_path = os.path.join(temp_dir, 'BODYDATA.TXT')
+            with open(body_data_path, 'wb') as body_data_file:
+                body_data_file.write(
+                    pathlib.Path('tests/BODYDATA.TXT').read_bytes())
+
+            for mtime in (1000000000, 1000000002):
+                os.utime(body_data_path, (mtime, mtime))
+                BodyData(body_data_path, cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_command_line_script(self):
+
+        """
+        Tests running the processor as a script, which should behave just as
+        calling its entry point does.
+        """
+
+        params = ['-i', self.correct_bodydata_path, '-f', 'json']
+
+        process, stdout, stderr = self._shell_call(params)
+
+        self.assertEqual(process.returncode, 0)
+        self.assertEqual(stderr, b'')
+        self.assertEqual(stdout, self._main_call(params)[1])
+
+    def test_command_line_help_and_version(self):
+
+        """
+        Tests help, the version and usage errors are written to the streams
+        given, with a status returned.
+        """
+
+        status, stdout, stderr = self._main_call(['--version'])
+        self.assertEqual((status, stdout, stderr), (0, b'0.1\n', b''))
+
+        status, stdout, stderr = self._main_call(['--help'])
+        self.assertEqual(status, 0)
+        self.assertTrue(stdout.startswith(b'Read Salter MiBody scale data'))
+        self.assertEqual(stderr, b'')
+
+        status, stdout, stderr = self._main_call(['--nonsense'])
+        self.assertEqual(status, 1)
+        self.assertEqual(stdout, b'')
+        self.assertIn(b'Usage:', stderr)
 
     def test_command_line_file_path_arguments(self):
 
@@ -123,35 +307,39 @@ class TestMiBodyProcessing(TestCase):
 
         # Test default parameters (should read BODYDATA.TXT and print JSON)
 
-        process, _, stderr = self._shell_call()
+        status, _, stderr = self._main_call()
 
         # Should have an error as BODYDATA.TXT doesn't exist in same directory
 
+        self.assertEqual(status, 1)
         self.assertEqual(stderr, initial_input_error)
 
         # Should be fine this time as it's a correct path
 
-        process, _, stderr = self._shell_call([
+        status, _, stderr = self._main_call([
             '-i', self.correct_bodydata_path])
 
+        self.assertEqual(status, 0)
         self.assertNotEqual(stderr, initial_input_error)
 
         # If we provide with another invalid path...
 
-        process, _, stderr = self._shell_call([
+        status, _, stderr = self._main_call([
             '-i', '../tests/NON_BODYDATA.TXT'])
 
         full_path = os.path.realpath(os.path.join('tests', 'NON_BODYDATA.TXT'))
+        self.assertEqual(status, 1)
         self.assertEqual(
             stderr, bytes("File, '{}' not found\n".format(full_path).encode()))
 
         # If we provide an invalid file (empty or malformed)
 
-        for path in ('../tests/DUD_BODYDATA.TXT', '../tests/DUD_BODYDATA.TXT'):
+        for path in ('../tests/DUD_BODYDATA.TXT', '../tests/EMPTY_FILE.TXT'):
 
-            process, _, stderr = self._shell_call(['-i', path])
+            status, _, stderr = self._main_call(['-i', path])
 
             full_path = os.path.realpath(os.path.join('tests', path))
+            self.assertEqual(status, 1)
             self.assertEqual(
                 stderr,
                 "File, '{}' has yielded no weigh-ins\n".format(
@@ -169,138 +357,129 @@ class TestMiBodyProcessing(TestCase):
 
         # By default, JSON (test later), provide invalid format
 
-        process, _, stderr = self._shell_call([
+        status, _, stderr = self._main_call([
             '-i', self.correct_bodydata_path, '-f', 'blah'])
+        self.assertEqual(status, 1)
         self.assertEqual(stderr, b"Format, 'blah' is invalid\n")
 
         # Setting format to CSV should be enough for an output
 
-        csv_file_path = './tests/BODYDATA.CSV'
+        csv_file_path = pathlib.Path('./tests/BODYDATA.CSV')
 
-        process, stdout, _ = self._shell_call([
+        _, stdout, _ = self._main_call([
             '-i', self.correct_bodydata_path, '-f', 'csv'])
         csv_output_1 = stdout
 
-        process, _, _ = self._shell_call([
+        self._main_call([
             '-i', self.correct_bodydata_path, '-f', 'csv',
             '-o', self.correct_csv_export_path])
-        csv_file_1 = open(csv_file_path, 'r')
-        csv_file_1_contents = csv_file_1.read()
+        csv_file_1_contents = csv_file_path.read_text()
+        csv_file_path.unlink()
 
         # Test CSV contents
 
         body_data = BodyData(body_data_path)
-        with open(csv_file_path) as csv_file:
-            reader = csv.reader(csv_file)
-            self.assertEqual(
-                csv_file_1_contents[:117], str(csv_output_1)[2:119])
-            self.assertEqual(
-                csv_file_1_contents[2620:2695], str(csv_output_1)[2727:2802])
-            for i, row in enumerate(reader):
-
-                # Test absolute values
-
-                if i == 0:
-                    self.assertEqual(row, [
-                        'Date/time', 'Gender', 'Age (years)', 'Height (CM)',
-                        'Fitness level', 'Weight (lbs)', 'BMI', 'Body fat (%)',
-                        'Muscle mass (%)', 'Visceral fat', 'BMR',
-                    ])
-                elif i == 1:
-                    self.assertEqual(row, [
-                        '2012-02-10 19:09:11', 'Male', '21', '175', '0',
-                        '147.04832887406002', '21.78', '14.5', '46.6', '3',
-                        '1661'])
-                elif i == 35:
-                    self.assertEqual(row, [
-                        '2012-01-26 03:25:56', 'Male', '21', '175', '0',
-                        '146.82786661187998', '21.75', '14.6', '46.7', '3',
-                        '1660'])
-
-                # Test per-row values
-
-                if i > 0:  # Not the header row
-                    row_data = body_data[i - 1]
-
-                    self.assertEqual(str(row_data.date_time), row[0])
-                    self.assertEqual(row_data.gender, row[1][0])
-                    self.assertEqual(row_data.age, int(row[2]))
-                    self.assertEqual(row_data.height, int(row[3]))
-                    self.assertEqual(row_data.fitness_level, int(row[4]))
-
-                    self.assertEqual(row_data.weight_lbs, float(row[5]))
-                    self.assertEqual(row_data.body_fat, float(row[7]))
-                    self.assertEqual(row_data.muscle_mass, float(row[8]))
-                    self.assertEqual(row_data.visceral_fat, int(row[9]))
-
-                    self.assertEqual(row_data.bmi, float(row[6]))
-                    self.assertEqual(row_data.bmr, int(row[10]))
-
-        csv_file_1.close()
-        os.unlink(csv_file_path)
+        rows = list(csv.reader(csv_file_1_contents.splitlines()))
+
+        # The file was read with its line endings translated, and printing
+        # to stdout adds a final newline
+
+        self.assertEqual(
+            csv_file_1_contents + '\n',
+            csv_output_1.decode().replace('\r\n', '\n'))
+
+        # Test absolute values
+
+        self.assertEqual(rows[0], [
+            'Date/time', 'Gender', 'Age (years)', 'Height (CM)',
+            'Fitness level', 'Weight (lbs)', 'BMI', 'Body fat (%)',
+            'Muscle mass (%)', 'Visceral fat', 'BMR',
+        ])
+        self.assertEqual(rows[1], [
+            '2012-02-10 19:09:11', 'Male', '21', '175', '0',
+            '147.04832887406002', '21.78', '14.5', '46.6', '3', '1661'])
+        self.assertEqual(rows[35], [
+            '2012-01-26 03:25:56', 'Male', '21', '175', '0',
+            '146.82786661187998', '21.75', '14.6', '46.7', '3', '1660'])
+
+        # Test per-row values, a column at a time
+
+        self.assertEqual(len(rows) - 1, len(body_data))
+        columns = dict(zip(rows[0], zip(*rows[1:])))
+
+        np.testing.assert_array_equal(
+            body_data.column('date_time_str'),
+            columns['Date/time'])
+        np.testing.assert_array_equal(
+            body_data.column('gender'),
+            [gender[0] for gender in columns['Gender']])
+
+        for name, heading, dtype in (
+                ('age', 'Age (years)', int),
+                ('height', 'Height (CM)', int),
+                ('fitness_level', 'Fitness level', int),
+                ('weight_lbs', 'Weight (lbs)', float),
+                ('body_fat', 'Body fat (%)', float),
+                ('muscle_mass', 'Muscle mass (%)', float),
+                ('visceral_fat', 'Visceral fat', int),
+                ('bmi', 'BMI', float),
+                ('bmr', 'BMR', int)):
+            np.testing.assert_array_equal(
+                body_data.column(name), np.array(columns[heading], dtype))
 
         # We can be confident the file contents are the correct in the CSV.
         # This time, we'll change the height/weight values and test.
 
         # First, test height value change to feet and inches
 
-        process, _, _ = self._shell_call([
+        self._main_call([
             '-i', self.correct_bodydata_path, '-f', 'csv',
             '-o', self.correct_csv_export_path, '-h', 'ft_in'])
-        csv_file_2 = open(csv_file_path, 'r')
-        csv_file_2_contents = csv_file_2.read()
+        csv_file_2_contents = csv_file_path.read_text()
+        csv_file_path.unlink()
 
         self.assertIn('),"Height (feet, inches)",Fi', str(csv_file_2_contents))
         self.assertIn('21,"5, 8.897637795275593",0', str(csv_file_2_contents))
 
-        csv_file_2.close()
-        os.unlink(csv_file_path)
-
         # Now test weight in KG
 
-        process, _, _ = self._shell_call([
+        self._main_call([
             '-i', self.correct_bodydata_path, '-f', 'csv',
             '-o', self.correct_csv_export_path, '-w', 'kg'])
-        csv_file_3 = open(csv_file_path, 'r')
-        csv_file_3_contents = csv_file_3.read()
+        csv_file_3_contents = csv_file_path.read_text()
+        csv_file_path.unlink()
 
         self.assertIn('vel,Weight (KG),BMI', str(csv_file_3_contents))
         self.assertIn('0,66.6,21.75', str(csv_file_3_contents))
 
-        csv_file_3.close()
-        os.unlink(csv_file_path)
-
         # Now test weight in stones, lbs
 
-        process, _, _ = self._shell_call([
+        self._main_call([
             '-i', self.correct_bodydata_path, '-f', 'csv',
             '-o', self.correct_csv_export_path, '-w', 'st_lbs'])
-        csv_file_4 = open(csv_file_path, 'r')
-        csv_file_4_contents = csv_file_4.read()
+        csv_file_4_contents = csv_file_path.read_text()
+        csv_file_path.unlink()
 
         self.assertIn(
             'vel,"Weight (stones, lbs)",BMI', str(csv_file_4_contents))
         self.assertIn(
             '0,"10, 6.825027999999989",21.75', str(csv_file_4_contents))
 
-        csv_file_4.close()
-        os.unlink(csv_file_path)
-
         # Test JSON output and a few more height/weight unit tests
 
         # Setting format to CSV should be enough for an output
 
-        json_file_path = './tests/BODYDATA.JSON'
+        json_file_path = pathlib.Path('./tests/BODYDATA.JSON')
 
-        process, stdout, _ = self._shell_call([
+        _, stdout, _ = self._main_call([
             '-i', self.correct_bodydata_path, '-f', 'json'])
         json_output_1 = json.loads(stdout.decode())
 
-        process, _, _ = self._shell_call([
+        self._main_call([
             '-i', self.correct_bodydata_path, '-f', 'json',
             '-o', self.correct_json_export_path])
-        json_file_1 = open(json_file_path, 'r')
-        json_file_1_contents = json.loads(json_file_1.read())
+        json_file_1_contents = json.loads(json_file_path.read_text())
+        json_file_path.unlink()
 
         self.assertEqual(json_output_1, json_file_1_contents)
 
@@ -310,12 +489,9 @@ class TestMiBodyProcessing(TestCase):
         self.assertIn('Height (CM)', json_output_1[0])
         self.assertEqual(json_output_1[34]['Height (CM)'], 175)
 
-        json_file_1.close()
-        os.unlink(json_file_path)
-
         # Change both height and weight values, ensuring they change in output
 
-        process, stdout, _ = self._shell_call([
+        _, stdout, _ = self._main_call([
             '-i', self.correct_bodydata_path, '-f', 'json',
             '-h', 'ft_in', '-w', 'kg'])
         json_output_2 = json.loads(stdout.decode())
@@ -340,9 +516,14 @@ class MiBodyUnitConversionTestCase(TestCase):
     Tests converting units from processed data.
     """
 
+    @classmethod
+    def setUpClass(cls):
+
+        cls.template_body_data = BodyData('tests/BODYDATA.TXT')
+
     def setUp(self):
 
-        self.body_data = BodyData('tests/BODYDATA.TXT')
+        self.body_data = copy.copy(self.template_body_data)
         self.assertEqual(len(self.body_data), 35)
 
     def test_converting_weight_units(self):
@@ -353,39 +534,48 @@ class MiBodyUnitConversionTestCase(TestCase):
 
         self.assertEqual(self.body_data[8].weight, 67.9)
         self.assertEqual(self.body_data[8].weight_kg, 67.9)
-        self.assertEqual(self.body_data[8].weight_oz, 2395.102016405)
-        self.assertEqual(self.body_data[8].weight_lbs, 149.69387602022002)
-        self.assertEqual(self.body_data[8].weight_stones, 10.692213)
-        self.assertEqual(
-            self.body_data[8].weight_lbs_oz,
-            (149, 11.102016323520274))
-        self.assertEqual(
-            self.body_data[8].weight_stones_lbs,
-            (10, 9.690982000000009))
+        self.assertAlmostEqual(
+            self.body_data[8].weight_oz, 2395.102016405, places=9)
+        self.assertAlmostEqual(
+            self.body_data[8].weight_lbs, 149.69387602022002, places=9)
+        self.assertAlmostEqual(
+            self.body_data[8].weight_stones, 10.692213, places=9)
+        pounds, ounces = self.body_data[8].weight_lbs_oz
+        self.assertEqual(pounds, 149)
+        self.assertAlmostEqual(ounces, 11.102016323520274, places=9)
+        stones, pounds = self.body_data[8].weight_stones_lbs
+        self.assertEqual(stones, 10)
+        self.assertAlmostEqual(pounds, 9.690982000000009, places=9)
 
         self.assertEqual(self.body_data[18].weight, 65.0)
         self.assertEqual(self.body_data[18].weight_kg, 65.0)
-        self.assertEqual(self.body_data[18].weight_oz, 2292.80752675)
-        self.assertEqual(self.body_data[18].weight_lbs, 143.300470417)
-        self.assertEqual(self.body_data[18].weight_stones, 10.23555)
-        self.assertEqual(
-            self.body_data[18].weight_lbs_oz,
-            (143, 4.807526672000222))
-        self.assertEqual(
-            self.body_data[18].weight_stones_lbs,
-            (10, 3.297699999999999))
+        self.assertAlmostEqual(
+            self.body_data[18].weight_oz, 2292.80752675, places=9)
+        self.assertAlmostEqual(
+            self.body_data[18].weight_lbs, 143.300470417, places=9)
+        self.assertAlmostEqual(
+            self.body_data[18].weight_stones, 10.23555, places=9)
+        pounds, ounces = self.body_data[18].weight_lbs_oz
+        self.assertEqual(pounds, 143)
+        self.assertAlmostEqual(ounces, 4.807526672000222, places=9)
+        stones, pounds = self.body_data[18].weight_stones_lbs
+        self.assertEqual(stones, 10)
+        self.assertAlmostEqual(pounds, 3.297699999999999, places=9)
 
         self.assertEqual(self.body_data[34].weight, 66.6)
         self.assertEqual(self.body_data[34].weight_kg, 66.6)
-        self.assertEqual(self.body_data[34].weight_oz, 2349.2458658699998)
-        self.assertEqual(self.body_data[34].weight_lbs, 146.82786661187998)
-        self.assertEqual(self.body_data[34].weight_stones, 10.487502)
-        self.assertEqual(
-            self.body_data[34].weight_lbs_oz,
-            (146, 13.245865790079733))
-        self.assertEqual(
-            self.body_data[34].weight_stones_lbs,
-            (10, 6.825027999999989))
+        self.assertAlmostEqual(
+            self.body_data[34].weight_oz, 2349.2458658699998, places=9)
+        self.assertAlmostEqual(
+            self.body_data[34].weight_lbs, 146.82786661187998, places=9)
+        self.assertAlmostEqual(
+            self.body_data[34].weight_stones, 10.487502, places=9)
+        pounds, ounces = self.body_data[34].weight_lbs_oz
+        self.assertEqual(pounds, 146)
+        self.assertAlmostEqual(ounces, 13.245865790079733, places=9)
+        stones, pounds = self.body_data[34].weight_stones_lbs
+        self.assertEqual(stones, 10)
+        self.assertAlmostEqual(pounds, 6.825027999999989, places=9)
 
     def test_converting_height_units(self):
 
@@ -395,12 +585,14 @@ class MiBodyUnitConversionTestCase(TestCase):
 
         self.assertEqual(self.body_data[34].height, 175)
         self.assertEqual(self.body_data[34].height_cm, 175)
-        self.assertEqual(self.body_data[34].height_m, 1.75)
-        self.assertEqual(self.body_data[34].height_inches, 68.89763779527559)
-        self.assertEqual(self.body_data[34].height_feet, 5.741469816272966)
-        self.assertEqual(
-            self.body_data[34].height_feet_inches,
-            (5, 8.897637795275593))
+        self.assertAlmostEqual(self.body_data[34].height_m, 1.75, places=9)
+        self.assertAlmostEqual(
+            self.body_data[34].height_inches, 68.89763779527559, places=9)
+        self.assertAlmostEqual(
+            self.body_data[34].height_feet, 5.741469816272966, places=9)
+        feet, inches = self.body_data[34].height_feet_inches
+        self.assertEqual(feet, 5)
+        self.assertAlmostEqual(inches, 8.897637795275593, places=9)
 
     def test_calculating_bmr(self):
 